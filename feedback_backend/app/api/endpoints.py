@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, Form
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from loguru import logger
+import base64
+import msgpack
 
 from app.core.config import settings
 from app.core.security import create_access_token, get_current_user
@@ -12,6 +16,21 @@ from app.schemas import schemas
 
 router = APIRouter()
 
+# Single dependency carrying both the DB session and the authenticated
+# user, so FastAPI resolves one Depends node per request instead of two.
+# get_db stays a sub-dependency (rather than opening the session inline)
+# so test-time dependency overrides keep working.
+@dataclass
+class AuthContext:
+    db: AsyncSession
+    user: schemas.TokenData
+
+async def auth_ctx(
+    db: AsyncSession = Depends(get_db),
+    user: schemas.TokenData = Depends(get_current_user)
+) -> AuthContext:
+    return AuthContext(db=db, user=user)
+
 # Define a consistent success response format
 def success_response(data):
     return {
@@ -19,24 +38,73 @@ def success_response(data):
         "data": data
     }
 
+# Cached TypeAdapters for the summary endpoints, which validate and dump
+# rows up front so the JSON-ready payload can be cached in Redis as-is.
+# The paginated endpoints declare Page[...] as their response_model
+# instead and hand FastAPI raw rows, which is the same single validation
+# pass while keeping the envelope in the OpenAPI schema.
+feedback_summary_list = TypeAdapter(List[schemas.FeedbackSummary])
+no_result_summary_list = TypeAdapter(List[schemas.NoResultSummary])
+
+def dump_rows(adapter: TypeAdapter, rows) -> List[dict]:
+    return adapter.dump_python(adapter.validate_python(rows), mode="json")
+
+# Keyset pagination cursors: an opaque base64 wrapper around the
+# (created_at, id) of the last row on the previous page
+def encode_cursor(row) -> str:
+    raw = f"{row.created_at.isoformat()}:{row.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, _, row_id = raw.rpartition(":")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+# Redis helpers for cacheable summary endpoints. Redis being down is never
+# fatal: a failed GET/SETEX just falls through to the database.
+async def cache_get(request: Request, key: str):
+    redis = getattr(request.app.state, "redis", None)
+    if redis is None:
+        return None
+    try:
+        cached = await redis.get(key)
+    except Exception as e:
+        logger.warning(f"Redis GET failed for {key}: {str(e)}")
+        return None
+    if cached is None:
+        return None
+    return msgpack.unpackb(cached)
+
+async def cache_set(request: Request, key: str, rows):
+    redis = getattr(request.app.state, "redis", None)
+    if redis is None:
+        return
+    try:
+        await redis.setex(key, settings.SUMMARY_CACHE_TTL, msgpack.packb(rows))
+    except Exception as e:
+        logger.warning(f"Redis SETEX failed for {key}: {str(e)}")
+
 # Authentication endpoints
 @router.get("/me")
 async def get_current_user_info(
-    current_user: schemas.TokenData = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: schemas.TokenData = Depends(get_current_user)
 ):
     """
     Get current user information endpoint
     Returns user info if token is valid, 401 if not
+    The username comes straight from the verified JWT claims, so no
+    database round-trip is needed here
     """
-    user = crud.get_user(db, current_user.username)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
     return success_response({
-        "username": user.username,
+        "username": current_user.username,
         "is_authenticated": True
     })
 
@@ -56,14 +124,15 @@ async def logout(current_user: schemas.TokenData = Depends(get_current_user)):
 async def login(
     username: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Login endpoint for user authentication
     """
-    logger.debug(f"Login attempt for user: {username}")
-    
-    user = crud.authenticate_user(db, username, password)
+    # Lazy so the message is only formatted when a DEBUG sink is active
+    logger.opt(lazy=True).debug("Login attempt for user: {}", lambda: username)
+
+    user = await crud.authenticate_user(db, username, password)
     if not user:
         logger.warning(f"Authentication failed for user: {username}")
         raise HTTPException(
@@ -79,105 +148,113 @@ async def login(
     return success_response({"access_token": access_token, "token_type": "bearer"})
 
 # Feedback endpoints
-@router.get("/feedback/summary", response_model=List[schemas.FeedbackSummary])
+@router.get("/feedback/summary")
 async def get_feedback_summary(
-    limit: int = 10,
-    db: Session = Depends(get_db),
-    current_user: schemas.TokenData = Depends(get_current_user)
+    request: Request,
+    limit: int = Query(10, ge=1, le=100),
+    ctx: AuthContext = Depends(auth_ctx)
 ):
     """
     Get feedback summary endpoint
     """
-    if limit < 1 or limit > 100:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Limit must be between 1 and 100"
-        )
-    return crud.get_feedback_summary(db=db, limit=limit)
+    cache_key = f"feedback:summary:{limit}"
+    cached = await cache_get(request, cache_key)
+    if cached is not None:
+        return cached
+    rows = await crud.get_feedback_summary(db=ctx.db, limit=limit)
+    rows = dump_rows(feedback_summary_list, [dict(row._mapping) for row in rows])
+    await cache_set(request, cache_key, rows)
+    return rows
 
 # QA Logs endpoints
-@router.get("/qa-logs", response_model=List[schemas.QALog])
+@router.get("/qa-logs", response_model=schemas.Page[schemas.QALogPreview])
 async def get_qa_logs(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=100),
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: schemas.TokenData = Depends(get_current_user)
+    ctx: AuthContext = Depends(auth_ctx)
 ):
     """
-    Get QA logs endpoint
+    Get QA logs endpoint, keyset-paginated via an opaque cursor
     """
-    if skip < 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Skip value cannot be negative"
-        )
-    if limit < 1 or limit > 100:
+    # Fetch one extra row to detect the next page without a COUNT(*)
+    rows = await crud.get_qa_logs(
+        db=ctx.db, cursor=decode_cursor(cursor), limit=limit + 1, search=search
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1]) if has_more else None
+    return {
+        "items": rows,
+        "has_more": has_more,
+        "next_cursor": next_cursor
+    }
+
+@router.get("/qa-logs/{log_id}", response_model=schemas.QALog)
+async def get_qa_log(
+    log_id: int,
+    ctx: AuthContext = Depends(auth_ctx)
+):
+    """
+    Get a single QA log, with the full response text the list view omits
+    """
+    row = await crud.get_qa_log(db=ctx.db, log_id=log_id)
+    if row is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Limit must be between 1 and 100"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="QA log not found"
         )
-    return crud.get_qa_logs(db=db, skip=skip, limit=limit, search=search)
+    return row
 
 # Low Similarity Queries endpoints
-@router.get("/low-similarity", response_model=List[schemas.LowSimilarityQuery])
+@router.get("/low-similarity", response_model=schemas.Page[schemas.LowSimilarityQuery])
 async def get_low_similarity_queries(
-    skip: int = 0,
-    limit: int = 100,
-    min_score: Optional[float] = None,
-    max_score: Optional[float] = None,
-    db: Session = Depends(get_db),
-    current_user: schemas.TokenData = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=100),
+    min_score: Optional[float] = Query(None, ge=0.0, le=1.0),
+    max_score: Optional[float] = Query(None, ge=0.0, le=1.0),
+    ctx: AuthContext = Depends(auth_ctx)
 ):
     """
-    Get low similarity queries endpoint
+    Get low similarity queries endpoint, keyset-paginated via an opaque cursor
     """
-    if skip < 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Skip value cannot be negative"
-        )
-    if limit < 1 or limit > 100:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Limit must be between 1 and 100"
-        )
-    if min_score is not None and (min_score < 0 or min_score > 1):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Minimum score must be between 0 and 1"
-        )
-    if max_score is not None and (max_score < 0 or max_score > 1):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Maximum score must be between 0 and 1"
-        )
     if min_score is not None and max_score is not None and min_score > max_score:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Minimum score cannot be greater than maximum score"
         )
-    return crud.get_low_similarity_queries(
-        db=db,
-        skip=skip,
-        limit=limit,
+    # Fetch one extra row to detect the next page without a COUNT(*)
+    rows = await crud.get_low_similarity_queries(
+        db=ctx.db,
+        cursor=decode_cursor(cursor),
+        limit=limit + 1,
         min_score=min_score,
         max_score=max_score
     )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1]) if has_more else None
+    return {
+        "items": rows,
+        "has_more": has_more,
+        "next_cursor": next_cursor
+    }
 
 # No Result Logs endpoints
-@router.get("/no-result/summary", response_model=List[schemas.NoResultSummary])
+@router.get("/no-result/summary")
 async def get_no_result_summary(
-    limit: int = 10,
-    db: Session = Depends(get_db),
-    current_user: schemas.TokenData = Depends(get_current_user)
+    request: Request,
+    limit: int = Query(10, ge=1, le=100),
+    ctx: AuthContext = Depends(auth_ctx)
 ):
     """
     Get no result queries summary endpoint
     """
-    if limit < 1 or limit > 100:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Limit must be between 1 and 100"
-        )
-    return crud.get_no_result_summary(db=db, limit=limit) 
\ No newline at end of file
+    cache_key = f"no-result:summary:{limit}"
+    cached = await cache_get(request, cache_key)
+    if cached is not None:
+        return cached
+    rows = await crud.get_no_result_summary(db=ctx.db, limit=limit)
+    rows = dump_rows(no_result_summary_list, [dict(row._mapping) for row in rows])
+    await cache_set(request, cache_key, rows)
+    return rows 
\ No newline at end of file
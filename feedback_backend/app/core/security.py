@@ -1,5 +1,8 @@
 from datetime import datetime, timedelta
 from typing import Optional
+import threading
+import time
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from .config import settings
@@ -13,6 +16,13 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Decoded-token cache: clients resend the same bearer token on every
+# request, so the HMAC verification only needs to run once per minute per
+# token. Keys are the raw (high-entropy) token strings; values keep the
+# token's exp so a cache hit can still reject an expired token.
+_token_cache = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = threading.Lock()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password
@@ -38,7 +48,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenData:
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenData:
     """
     Get current user from JWT token
     """
@@ -47,6 +57,13 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenData:
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+    if cached is not None:
+        token_data, exp = cached
+        if exp is not None and exp <= time.time():
+            raise credentials_exception
+        return token_data
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         username: str = payload.get("sub")
@@ -55,4 +72,6 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenData:
         token_data = TokenData(username=username)
     except JWTError:
         raise credentials_exception
+    with _token_cache_lock:
+        _token_cache[token] = (token_data, payload.get("exp"))
     return token_data 
\ No newline at end of file
@@ -1,46 +1,85 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, desc, text, tuple_
+from typing import List, Optional, Tuple
+from datetime import datetime
 from loguru import logger
+from cachetools import TTLCache
+from app.core.database import engine
 from app.models.models import User, Feedback, QALogs, LowSimilarityQueries, NoResultLogs
 from app.schemas import schemas
 from app.core.security import verify_password
+import asyncio
 import bcrypt
+import hashlib
+import threading
 from fastapi import HTTPException, status
 
+# In-process TTL caches for the hot auth path. The user table is tiny and
+# every authenticated request resolves the same row, so a short TTL saves
+# one SELECT per request; the auth cache additionally skips bcrypt for
+# repeated logins with the same credentials.
+_user_cache = TTLCache(maxsize=1024, ttl=60)
+_auth_cache = TTLCache(maxsize=1024, ttl=30)
+_cache_lock = threading.Lock()
+
+def invalidate_user_cache(username: str):
+    """
+    Drop cached entries for a user (call after create/update)
+    """
+    with _cache_lock:
+        _user_cache.pop(username, None)
+        for key in [k for k in _auth_cache if k[0] == username]:
+            _auth_cache.pop(key, None)
+
 # User operations
-def get_user(db: Session, username: str) -> Optional[User]:
+async def get_user(db: AsyncSession, username: str) -> Optional[User]:
     """
     Get user by username
     """
     try:
-        return db.query(User).filter(User.username == username).first()
+        with _cache_lock:
+            user = _user_cache.get(username)
+        if user is not None:
+            return user
+        result = await db.execute(select(User).where(User.username == username))
+        user = result.scalar_one_or_none()
+        if user is not None:
+            with _cache_lock:
+                _user_cache[username] = user
+        return user
     except Exception as e:
         logger.error(f"Error in get_user: {str(e)}")
         raise
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
     """
     Authenticate user by verifying the password
     """
     try:
-        user = get_user(db, username)
+        user = await get_user(db, username)
         if not user:
             logger.warning(f"User not found: {username}")
             return None
 
-        # Log the stored password hash for debugging
-        logger.debug(f"Stored password hash: {user.password}")
-        logger.debug(f"Password: {password}, password hashed: {bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())}")
-        logger.debug(f"Compare password: {password.encode('utf-8')}, {user.password.strip().encode('utf-8')}")
-        logger.debug(f"Is valid: {bcrypt.checkpw(password.encode('utf-8'), user.password.strip().encode('utf-8'))}")
-        
+        auth_key = (username, hashlib.sha256(password.encode('utf-8')).hexdigest())
+        with _cache_lock:
+            cached = _auth_cache.get(auth_key)
+        if cached is not None:
+            if not cached:
+                logger.warning(f"Invalid password for user: {username}")
+                return None
+            return user
+
         try:
-            # Verify the password using bcrypt
-            is_valid = bcrypt.checkpw(
+            # Verify the password using bcrypt; offloaded to a worker
+            # thread so the tens-of-ms hash doesn't stall the event loop
+            is_valid = await asyncio.to_thread(
+                bcrypt.checkpw,
                 password.encode('utf-8'),
                 user.password.strip().encode('utf-8')
             )
+            with _cache_lock:
+                _auth_cache[auth_key] = is_valid
             if not is_valid:
                 logger.warning(f"Invalid password for user: {username}")
                 return None
@@ -59,83 +98,187 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[Use
         )
 
 # Feedback operations
-def get_feedback_summary(db: Session, limit: int = 10) -> List[dict]:
+
+# Live aggregation; used directly on non-Postgres backends and as the
+# definition of the materialized view below. Feedback is aggregated per
+# message_id in a CTE first, so the heavy group-by runs over the feedback
+# table alone instead of the wide qa_logs x feedback join output.
+def feedback_summary_stmt(limit: Optional[int] = None):
+    agg = select(
+        Feedback.message_id,
+        func.count().filter(Feedback.liked == True).label("satisfied_count"),
+        func.count().filter(Feedback.liked == False).label("unsatisfied_count"),
+        func.count().label("total_count")
+    ).group_by(
+        Feedback.message_id
+    ).cte("feedback_agg")
+    stmt = select(
+        QALogs.query,
+        func.sum(agg.c.satisfied_count).label("satisfied_count"),
+        func.sum(agg.c.unsatisfied_count).label("unsatisfied_count"),
+        func.sum(agg.c.total_count).label("total_count")
+    ).join(
+        agg,
+        QALogs.task_id == agg.c.message_id
+    ).group_by(
+        QALogs.query
+    )
+    if limit is not None:
+        stmt = stmt.order_by(desc("unsatisfied_count")).limit(limit)
+    return stmt
+
+FEEDBACK_SUMMARY_MV = "feedback_summary_mv"
+
+async def ensure_feedback_summary_mv():
+    """
+    Create the feedback summary materialized view and its indexes
+    (Postgres only; the unique index is required for REFRESH CONCURRENTLY)
+    """
+    mv_select = feedback_summary_stmt().compile(
+        dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+    )
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            f"CREATE MATERIALIZED VIEW IF NOT EXISTS {FEEDBACK_SUMMARY_MV} AS {mv_select}"
+        ))
+        await conn.execute(text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS ux_feedback_summary_mv_query "
+            f"ON {FEEDBACK_SUMMARY_MV} (query)"
+        ))
+        await conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_feedback_summary_mv_unsatisfied "
+            f"ON {FEEDBACK_SUMMARY_MV} (unsatisfied_count DESC)"
+        ))
+
+async def refresh_feedback_summary_mv():
+    """
+    Refresh the feedback summary materialized view without blocking readers
+    """
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            f"REFRESH MATERIALIZED VIEW CONCURRENTLY {FEEDBACK_SUMMARY_MV}"
+        ))
+
+async def get_feedback_summary(db: AsyncSession, limit: int = 10) -> List[dict]:
     """
     Get feedback summary grouped by query
     """
     try:
-        return db.query(
-            QALogs.query,
-            func.count(Feedback.id).filter(Feedback.liked == True).label("satisfied_count"),
-            func.count(Feedback.id).filter(Feedback.liked == False).label("unsatisfied_count"),
-            func.count(Feedback.id).label("total_count")
-        ).join(
-            Feedback,
-            QALogs.task_id == Feedback.message_id
-        ).group_by(
-            QALogs.query
-        ).order_by(
-            desc("unsatisfied_count")
-        ).limit(limit).all()
+        if db.get_bind().dialect.name == "postgresql":
+            try:
+                # Top-K read from the precomputed aggregate instead of a
+                # join+group-by scan on every call
+                result = await db.execute(
+                    text(
+                        f"SELECT query, satisfied_count, unsatisfied_count, total_count "
+                        f"FROM {FEEDBACK_SUMMARY_MV} "
+                        f"ORDER BY unsatisfied_count DESC LIMIT :limit"
+                    ),
+                    {"limit": limit}
+                )
+                return result.all()
+            except Exception as e:
+                # The view may not exist yet (e.g. startup DDL failed).
+                # Roll the aborted transaction back and aggregate live
+                # until the refresh loop manages to create it.
+                logger.warning(
+                    f"Feedback summary view unavailable, aggregating live: {str(e)}"
+                )
+                await db.rollback()
+        result = await db.execute(feedback_summary_stmt(limit))
+        return result.all()
     except Exception as e:
         logger.error(f"Error in get_feedback_summary: {str(e)}")
         raise
 
 # QA Logs operations
-def get_qa_logs(
-    db: Session,
-    skip: int = 0,
+async def get_qa_logs(
+    db: AsyncSession,
+    cursor: Optional[Tuple[datetime, int]] = None,
     limit: int = 100,
     search: Optional[str] = None
-) -> List[QALogs]:
+):
     """
-    Get QA logs with optional search
+    Get QA logs with optional search, newest first.
+    `cursor` is the (created_at, id) of the last row of the previous page;
+    keyset pagination avoids the linear cost of OFFSET on deep pages.
+    Only list-view columns are selected; the wide response TEXT column
+    stays in the database.
     """
     try:
-        query = db.query(QALogs)
+        stmt = select(QALogs.id, QALogs.task_id, QALogs.query, QALogs.created_at)
         if search:
-            query = query.filter(QALogs.query.ilike(f"%{search}%"))
-        return query.offset(skip).limit(limit).all()
+            stmt = stmt.where(QALogs.query.ilike(f"%{search}%"))
+        if cursor is not None:
+            stmt = stmt.where(tuple_(QALogs.created_at, QALogs.id) < cursor)
+        stmt = stmt.order_by(QALogs.created_at.desc(), QALogs.id.desc()).limit(limit)
+        # Stream over a server-side cursor in yield_per batches rather than
+        # buffering the full result set in the driver before hydration
+        result = await db.stream(stmt.execution_options(yield_per=50))
+        return [row async for row in result]
     except Exception as e:
         logger.error(f"Error in get_qa_logs: {str(e)}")
         raise
 
+async def get_qa_log(db: AsyncSession, log_id: int) -> Optional[QALogs]:
+    """
+    Get a single QA log by id, including the full response text
+    that the list projection leaves out
+    """
+    try:
+        result = await db.execute(select(QALogs).where(QALogs.id == log_id))
+        return result.scalar_one_or_none()
+    except Exception as e:
+        logger.error(f"Error in get_qa_log: {str(e)}")
+        raise
+
 # Low Similarity Queries operations
-def get_low_similarity_queries(
-    db: Session,
-    skip: int = 0,
+async def get_low_similarity_queries(
+    db: AsyncSession,
+    cursor: Optional[Tuple[datetime, int]] = None,
     limit: int = 100,
     min_score: Optional[float] = None,
     max_score: Optional[float] = None
 ) -> List[LowSimilarityQueries]:
     """
-    Get low similarity queries with optional score range filter
+    Get low similarity queries with optional score range filter,
+    keyset-paginated by (created_at, id) newest first
     """
     try:
-        query = db.query(LowSimilarityQueries)
+        stmt = select(LowSimilarityQueries)
         if min_score is not None:
-            query = query.filter(LowSimilarityQueries.similarity_score >= min_score)
+            stmt = stmt.where(LowSimilarityQueries.similarity_score >= min_score)
         if max_score is not None:
-            query = query.filter(LowSimilarityQueries.similarity_score <= max_score)
-        return query.offset(skip).limit(limit).all()
+            stmt = stmt.where(LowSimilarityQueries.similarity_score <= max_score)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(LowSimilarityQueries.created_at, LowSimilarityQueries.id) < cursor
+            )
+        stmt = stmt.order_by(
+            LowSimilarityQueries.created_at.desc(), LowSimilarityQueries.id.desc()
+        ).limit(limit)
+        result = await db.stream(stmt.execution_options(yield_per=50))
+        return [row async for row in result.scalars()]
     except Exception as e:
         logger.error(f"Error in get_low_similarity_queries: {str(e)}")
         raise
 
 # No Result Logs operations
-def get_no_result_summary(db: Session, limit: int = 10) -> List[dict]:
+async def get_no_result_summary(db: AsyncSession, limit: int = 10) -> List[dict]:
     """
     Get summary of no result queries
     """
     try:
-        return db.query(
+        stmt = select(
             NoResultLogs.query,
             func.count(NoResultLogs.id).label("count")
         ).group_by(
             NoResultLogs.query
         ).order_by(
             desc("count")
-        ).limit(limit).all()
+        ).limit(limit)
+        result = await db.execute(stmt)
+        return result.all()
     except Exception as e:
         logger.error(f"Error in get_no_result_summary: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
@@ -1,13 +1,28 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
+import asyncio
+import functools
 import traceback
+import redis.asyncio as aioredis
 from loguru import logger
+from sqlalchemy import text
+from starlette.background import BackgroundTask
+from fastapi.dependencies import utils as fastapi_dependency_utils
+
+# This FastAPI version re-runs inspect.signature() for every dependency
+# callable it analyzes (upstream added a cache in PR #13974). Memoize it
+# before any routers are imported so all Depends resolution benefits.
+fastapi_dependency_utils.get_typed_signature = functools.lru_cache(maxsize=1024)(
+    fastapi_dependency_utils.get_typed_signature
+)
 
 from app.api.endpoints import router
 from app.core.config import settings
+from app.core.database import engine
 from app.core.logger import setup_logging
+from app.crud import crud
 
 # Initialize logging
 setup_logging(env="dev")  # You can change this based on your environment
@@ -15,7 +30,8 @@ setup_logging(env="dev")  # You can change this based on your environment
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -29,6 +45,64 @@ app.add_middleware(
     max_age=3600,  
 )
 
+@app.on_event("startup")
+async def setup_redis():
+    """
+    Create the shared Redis client used for response caching
+    """
+    app.state.redis = aioredis.from_url(settings.REDIS_URL)
+
+@app.on_event("shutdown")
+async def close_redis():
+    await app.state.redis.aclose()
+
+@app.on_event("startup")
+async def setup_pg_trgm():
+    """
+    Ensure the pg_trgm extension exists so the trigram GIN index on
+    qa_logs.query can serve ILIKE searches (Postgres only)
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except Exception as e:
+        logger.warning(f"Could not ensure pg_trgm extension: {str(e)}")
+
+async def _refresh_feedback_summary_loop():
+    while True:
+        await asyncio.sleep(settings.FEEDBACK_SUMMARY_REFRESH_SECONDS)
+        try:
+            # ensure is idempotent and retries the view creation in case
+            # the startup DDL failed (e.g. the database was unreachable)
+            await crud.ensure_feedback_summary_mv()
+            await crud.refresh_feedback_summary_mv()
+        except Exception as e:
+            logger.warning(f"Feedback summary view refresh failed: {str(e)}")
+
+@app.on_event("startup")
+async def setup_feedback_summary_mv():
+    """
+    Create the feedback summary materialized view and keep it fresh
+    in the background (Postgres only)
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    try:
+        await crud.ensure_feedback_summary_mv()
+    except Exception as e:
+        logger.warning(f"Could not create feedback summary view: {str(e)}")
+    # Start the loop even if creation failed; it retries on every tick and
+    # get_feedback_summary falls back to live aggregation until then
+    app.state.mv_refresh_task = asyncio.create_task(_refresh_feedback_summary_loop())
+
+@app.on_event("shutdown")
+async def stop_feedback_summary_refresh():
+    task = getattr(app.state, "mv_refresh_task", None)
+    if task is not None:
+        task.cancel()
+
 def error_response(status_code: int, message: str, details: dict = None):
     response = {
         "success": False,
@@ -46,17 +120,19 @@ def error_response(status_code: int, message: str, details: dict = None):
 async def http_exception_handler(request: Request, exc: HTTPException):
     error_msg = f"HTTP exception handler caught: {str(exc)}\nStatus code: {exc.status_code}"
     if exc.status_code >= 500:
-        logger.error(error_msg)
+        log = logger.error
     elif exc.status_code >= 400:
-        logger.warning(error_msg)
+        log = logger.warning
     else:
-        logger.info(error_msg)
-    
+        log = logger.info
+
     headers = getattr(exc, 'headers', None)
+    # Log in a background task so the response flushes first
     return JSONResponse(
         status_code=exc.status_code,
         content=error_response(exc.status_code, str(exc.detail)),
-        headers=headers
+        headers=headers,
+        background=BackgroundTask(log, error_msg)
     )
 
 # # Validation exception handler
@@ -64,29 +140,31 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(ResponseValidationError)
 async def validation_exception_handler(request: Request, exc: Exception):
     error_msg = f"Validation error: {str(exc)}"
-    logger.warning(error_msg)
     return JSONResponse(
         status_code=422,
         content=error_response(
             422,
             "Validation Error",
             {"errors": exc.errors() if hasattr(exc, 'errors') else str(exc)}
-        )
+        ),
+        background=BackgroundTask(logger.warning, error_msg)
     )
 
 # Global exception handler for all other exceptions
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    error_msg = f"Global exception handler caught: {str(exc)}\n{traceback.format_exc()}"
-    logger.error(error_msg)
+    # Format the traceback once and reuse it for both the log and the body
+    tb = traceback.format_exc()
+    error_msg = f"Global exception handler caught: {str(exc)}\n{tb}"
 
     return JSONResponse(
         status_code=500,
         content=error_response(
             500,
             "Internal Server Errorddddd",
-            {"traceback": traceback.format_exc()}
-        )
+            {"traceback": tb}
+        ),
+        background=BackgroundTask(logger.error, error_msg)
     )
 
 # Include API router
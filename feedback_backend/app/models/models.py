@@ -42,7 +42,13 @@ class QALogs(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     __table_args__ = (
-        Index('ix_qa_logs_query_text', 'query', postgresql_using='gin'),
+        # Trigram opclass so the GIN index actually serves ILIKE '%...%'
+        # searches (requires the pg_trgm extension, ensured at startup)
+        Index('ix_qa_logs_query_trgm', 'query', postgresql_using='gin',
+              postgresql_ops={'query': 'gin_trgm_ops'}),
+        # Append-only table: a BRIN on created_at keeps time-range scans
+        # cheap at a fraction of a btree's size
+        Index('brin_qa_logs_created_at', 'created_at', postgresql_using='brin'),
     )
 
 class LowSimilarityQueries(Base):
@@ -63,6 +69,10 @@ class LowSimilarityQueries(Base):
     __table_args__ = (
         CheckConstraint('query_type IN (0, 1)', name='check_query_type'),
         Index('ix_low_similarity_queries_score_type', 'similarity_score', 'query_type'),
+        # Covering index for the score-range + newest-first listing; the
+        # INCLUDE payload enables index-only scans with no heap lookups
+        Index('ix_lsq_score_created', 'similarity_score', 'created_at',
+              postgresql_include=['query_type', 'col', 'metric_type']),
     )
 
 class NoResultLogs(Base):
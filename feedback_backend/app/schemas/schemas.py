@@ -1,7 +1,16 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Generic, Optional, List, TypeVar
 from datetime import datetime
 
+T = TypeVar("T")
+
+# Generic page envelope for keyset-paginated list endpoints.
+# has_more is detected by fetching limit+1 rows, so no COUNT(*) is needed.
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
 # User schemas
 class UserBase(BaseModel):
     username: str
@@ -56,6 +65,17 @@ class QALog(QALogBase):
     class Config:
         from_attributes = True
 
+# Lightweight row for the QA logs list view; leaves out the large
+# response TEXT column, which only detail views need
+class QALogPreview(BaseModel):
+    id: int
+    task_id: str
+    query: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
 # Low Similarity Queries schemas
 class LowSimilarityQueryBase(BaseModel):
     query_type: int = Field(..., ge=0, le=1)
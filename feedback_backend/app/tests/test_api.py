@@ -1,38 +1,62 @@
+from datetime import datetime, timedelta
+import time
+
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 import pytest
 from app.main import app
 from app.core.database import Base, get_db
-from app.core.security import get_password_hash
+from app.core import security
+from app.core.security import get_password_hash, create_access_token
+from app.models.models import QALogs
 
-# Create in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite://"
+# Create file-backed SQLite database for testing (shared between the sync
+# engine used for DDL and the async engine used by the app)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
+async def override_get_db():
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
 
 client = TestClient(app)
 
+SyncTestingSession = sessionmaker(bind=engine)
+
 @pytest.fixture
 def test_db():
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
+def seed_qa_logs(count):
+    # Distinct created_at per row so the (created_at, id) keyset order
+    # is deterministic
+    with SyncTestingSession() as session:
+        for i in range(1, count + 1):
+            session.add(QALogs(
+                task_id=f"task-{i}",
+                query=f"query {i}",
+                response=f"response {i}",
+                created_at=datetime(2024, 1, 1, 12, 0, i),
+            ))
+        session.commit()
+
+def auth_headers(username="testuser"):
+    token = create_access_token({"sub": username}, timedelta(minutes=5))
+    return {"Authorization": f"Bearer {token}"}
+
 def test_create_user(test_db):
     response = client.post(
         "/api/v1/users",
@@ -118,4 +142,65 @@ def test_create_qa_log_unauthorized():
 
 def test_get_qa_logs_unauthorized():
     response = client.get("/api/v1/qa-logs")
-    assert response.status_code == 401 
\ No newline at end of file
+    assert response.status_code == 401
+
+def test_qa_logs_cursor_round_trip(test_db):
+    seed_qa_logs(6)
+
+    first = client.get(
+        "/api/v1/qa-logs", params={"limit": 3}, headers=auth_headers()
+    )
+    assert first.status_code == 200
+    page = first.json()
+    assert [row["query"] for row in page["items"]] == ["query 6", "query 5", "query 4"]
+    assert page["has_more"] is True
+    assert page["next_cursor"] is not None
+
+    second = client.get(
+        "/api/v1/qa-logs",
+        params={"limit": 3, "cursor": page["next_cursor"]},
+        headers=auth_headers()
+    )
+    assert second.status_code == 200
+    page = second.json()
+    assert [row["query"] for row in page["items"]] == ["query 3", "query 2", "query 1"]
+    assert page["has_more"] is False
+    assert page["next_cursor"] is None
+
+def test_qa_logs_invalid_cursor(test_db):
+    response = client.get(
+        "/api/v1/qa-logs",
+        params={"cursor": "not-a-cursor"},
+        headers=auth_headers()
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "Invalid cursor"
+
+def test_qa_logs_has_more_trims_probe_row(test_db):
+    seed_qa_logs(3)
+
+    # The probe row fetched beyond the limit must not leak into the page
+    partial = client.get(
+        "/api/v1/qa-logs", params={"limit": 2}, headers=auth_headers()
+    ).json()
+    assert len(partial["items"]) == 2
+    assert partial["has_more"] is True
+
+    # A page that exactly exhausts the table reports no further pages
+    exact = client.get(
+        "/api/v1/qa-logs", params={"limit": 3}, headers=auth_headers()
+    ).json()
+    assert len(exact["items"]) == 3
+    assert exact["has_more"] is False
+    assert exact["next_cursor"] is None
+
+def test_expired_cached_token_rejected():
+    token = create_access_token({"sub": "testuser"}, timedelta(minutes=5))
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/api/v1/me", headers=headers).status_code == 200
+
+    # Age the cached entry past its exp; a cache hit must still reject it
+    with security._token_cache_lock:
+        token_data, _ = security._token_cache[token]
+        security._token_cache[token] = (token_data, time.time() - 1)
+    assert client.get("/api/v1/me", headers=headers).status_code == 401
\ No newline at end of file
@@ -37,6 +37,9 @@ const LowSimilarityAnalysis: React.FC = () => {
     pageSize: 20,
     total: 0,
   });
+  // Cursor for each visited page (index = page number - 1); the API is
+  // keyset-paginated, so pages are only reachable sequentially
+  const [pageCursors, setPageCursors] = useState<(string | null)[]>([null]);
 
   useEffect(() => {
     loadData();
@@ -45,25 +48,31 @@ const LowSimilarityAnalysis: React.FC = () => {
   const loadData = async () => {
     try {
       setLoading(true);
-      const skip = (pagination.current - 1) * pagination.pageSize;
+      const cursor = pageCursors[pagination.current - 1] ?? null;
       const result = await lowSimilarityAPI.getQueries(
-        skip,
+        cursor,
         pagination.pageSize,
         scoreRange[0],
         scoreRange[1]
       );
-      
+
       // Filter by metric type if selected
-      const filteredData = selectedMetricType 
-        ? result.filter(item => item.metric_type === selectedMetricType)
-        : result;
-      
+      const filteredData = selectedMetricType
+        ? result.items.filter(item => item.metric_type === selectedMetricType)
+        : result.items;
+
       setData(filteredData);
+      setPageCursors(prev => {
+        const next = [...prev];
+        next[pagination.current] = result.next_cursor;
+        return next;
+      });
+      // The API has no COUNT(*); has_more only ever admits one more page
       setPagination(prev => ({
         ...prev,
-        total: filteredData.length < pagination.pageSize ? 
-          skip + filteredData.length : 
-          skip + filteredData.length + 1
+        total: (prev.current - 1) * prev.pageSize +
+          filteredData.length +
+          (result.has_more ? 1 : 0)
       }));
     } catch (err) {
       setError('Failed to load low similarity data');
@@ -79,6 +88,16 @@ const LowSimilarityAnalysis: React.FC = () => {
   };
 
   const handleTableChange = (paginationConfig: any) => {
+    // Changing the page size invalidates every saved cursor
+    if (paginationConfig.pageSize !== pagination.pageSize) {
+      setPageCursors([null]);
+      setPagination({
+        ...pagination,
+        current: 1,
+        pageSize: paginationConfig.pageSize,
+      });
+      return;
+    }
     setPagination({
       ...pagination,
       current: paginationConfig.current,
@@ -88,11 +107,13 @@ const LowSimilarityAnalysis: React.FC = () => {
 
   const handleScoreRangeChange = (value: number[]) => {
     setScoreRange([value[0], value[1]]);
+    setPageCursors([null]);
     setPagination(prev => ({ ...prev, current: 1 }));
   };
 
   const handleMetricTypeChange = (value: string) => {
     setSelectedMetricType(value === 'all' ? undefined : value);
+    setPageCursors([null]);
     setPagination(prev => ({ ...prev, current: 1 }));
   };
 
@@ -309,8 +330,7 @@ const LowSimilarityAnalysis: React.FC = () => {
           pagination={{
             ...pagination,
             showSizeChanger: true,
-            showQuickJumper: true,
-            showTotal: (total, range) => 
+            showTotal: (total, range) =>
               `${range[0]}-${range[1]} of ${total} items`,
           }}
           onChange={handleTableChange}
@@ -15,14 +15,14 @@ import {
 import type { ColumnsType } from 'antd/es/table';
 import { SearchOutlined, EyeOutlined, CalendarOutlined } from '@ant-design/icons';
 import dayjs from 'dayjs';
-import { QALog } from '../types';
+import { QALog, QALogPreview } from '../types';
 import { qaLogsAPI } from '../services/api';
 
 const { Title } = Typography;
 const { Search } = Input;
 
 const QALogs: React.FC = () => {
-  const [data, setData] = useState<QALog[]>([]);
+  const [data, setData] = useState<QALogPreview[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [searchText, setSearchText] = useState('');
@@ -33,6 +33,9 @@ const QALogs: React.FC = () => {
     pageSize: 20,
     total: 0,
   });
+  // Cursor for each visited page (index = page number - 1); the API is
+  // keyset-paginated, so pages are only reachable sequentially
+  const [pageCursors, setPageCursors] = useState<(string | null)[]>([null]);
 
   useEffect(() => {
     loadQALogs();
@@ -41,20 +44,24 @@ const QALogs: React.FC = () => {
   const loadQALogs = async () => {
     try {
       setLoading(true);
-      const skip = (pagination.current - 1) * pagination.pageSize;
+      const cursor = pageCursors[pagination.current - 1] ?? null;
       const result = await qaLogsAPI.getLogs(
-        skip, 
-        pagination.pageSize, 
+        cursor,
+        pagination.pageSize,
         searchText || undefined
       );
-      setData(result);
-      // Note: In a real application, you would get the total count from the API
-      // For now, we'll estimate based on the returned data
+      setData(result.items);
+      setPageCursors(prev => {
+        const next = [...prev];
+        next[pagination.current] = result.next_cursor;
+        return next;
+      });
+      // The API has no COUNT(*); has_more only ever admits one more page
       setPagination(prev => ({
         ...prev,
-        total: result.length < pagination.pageSize ? 
-          skip + result.length : 
-          skip + result.length + 1
+        total: (prev.current - 1) * prev.pageSize +
+          result.items.length +
+          (result.has_more ? 1 : 0)
       }));
     } catch (err) {
       setError('Failed to load QA logs data');
@@ -66,15 +73,33 @@ const QALogs: React.FC = () => {
 
   const handleSearch = (value: string) => {
     setSearchText(value);
+    setPageCursors([null]);
     setPagination(prev => ({ ...prev, current: 1 }));
   };
 
-  const handleViewDetails = (record: QALog) => {
-    setSelectedRecord(record);
-    setModalVisible(true);
+  const handleViewDetails = async (record: QALogPreview) => {
+    try {
+      // The list omits the response text; fetch the full record on demand
+      const detail = await qaLogsAPI.getLog(record.id);
+      setSelectedRecord(detail);
+      setModalVisible(true);
+    } catch (err) {
+      setError('Failed to load QA log details');
+      console.error('QA log detail loading error:', err);
+    }
   };
 
   const handleTableChange = (paginationConfig: any) => {
+    // Changing the page size invalidates every saved cursor
+    if (paginationConfig.pageSize !== pagination.pageSize) {
+      setPageCursors([null]);
+      setPagination({
+        ...pagination,
+        current: 1,
+        pageSize: paginationConfig.pageSize,
+      });
+      return;
+    }
     setPagination({
       ...pagination,
       current: paginationConfig.current,
@@ -83,7 +108,7 @@ const QALogs: React.FC = () => {
   };
 
   // Table columns configuration
-  const columns: ColumnsType<QALog> = [
+  const columns: ColumnsType<QALogPreview> = [
     {
       title: 'Task ID',
       dataIndex: 'task_id',
@@ -106,17 +131,6 @@ const QALogs: React.FC = () => {
         </div>
       ),
     },
-    {
-      title: 'Response',
-      dataIndex: 'response',
-      key: 'response',
-      width: '35%',
-      render: (text: string) => (
-        <div className="max-w-md">
-          <p className="truncate text-sm" title={text}>{text}</p>
-        </div>
-      ),
-    },
     {
       title: 'Created At',
       dataIndex: 'created_at',
@@ -200,8 +214,7 @@ const QALogs: React.FC = () => {
           pagination={{
             ...pagination,
             showSizeChanger: true,
-            showQuickJumper: true,
-            showTotal: (total, range) => 
+            showTotal: (total, range) =>
               `${range[0]}-${range[1]} of ${total} items`,
           }}
           onChange={handleTableChange}
@@ -3,8 +3,10 @@ import {
   Token,
   FeedbackSummary,
   QALog,
+  QALogPreview,
   LowSimilarityQuery,
   NoResultSummary,
+  Page,
   LoginSuccessResponse,
   LoginErrorResponse,
 } from "../types";
@@ -125,10 +127,24 @@ export const feedbackAPI = {
 
 // QA Logs API
 export const qaLogsAPI = {
-  getLogs: async (skip = 0, limit = 100, search?: string): Promise<QALog[]> => {
-    const response: AxiosResponse<QALog[]> = await api.get("/api/v1/qa-logs", {
-      params: { skip, limit, search },
-    });
+  getLogs: async (
+    cursor: string | null = null,
+    limit = 100,
+    search?: string
+  ): Promise<Page<QALogPreview>> => {
+    const response: AxiosResponse<Page<QALogPreview>> = await api.get(
+      "/api/v1/qa-logs",
+      {
+        params: { cursor: cursor ?? undefined, limit, search },
+      }
+    );
+    return response.data;
+  },
+
+  getLog: async (id: number): Promise<QALog> => {
+    const response: AxiosResponse<QALog> = await api.get(
+      `/api/v1/qa-logs/${id}`
+    );
     return response.data;
   },
 };
@@ -136,15 +152,15 @@ export const qaLogsAPI = {
 // Low Similarity API
 export const lowSimilarityAPI = {
   getQueries: async (
-    skip = 0,
+    cursor: string | null = null,
     limit = 100,
     min_score?: number,
     max_score?: number
-  ): Promise<LowSimilarityQuery[]> => {
-    const response: AxiosResponse<LowSimilarityQuery[]> = await api.get(
+  ): Promise<Page<LowSimilarityQuery>> => {
+    const response: AxiosResponse<Page<LowSimilarityQuery>> = await api.get(
       "/api/v1/low-similarity",
       {
-        params: { skip, limit, min_score, max_score },
+        params: { cursor: cursor ?? undefined, limit, min_score, max_score },
       }
     );
     return response.data;
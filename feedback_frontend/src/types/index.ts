@@ -11,14 +11,18 @@ export interface FeedbackSummary {
   total_count: number;
 }
 
-export interface QALog {
+// List rows omit the large response text; the detail endpoint returns it
+export interface QALogPreview {
   task_id: string;
   query: string;
-  response: string;
   id: number;
   created_at: string;
 }
 
+export interface QALog extends QALogPreview {
+  response: string;
+}
+
 export interface LowSimilarityQuery {
   query_type: number;
   col: string;
@@ -35,6 +39,14 @@ export interface NoResultSummary {
   count: number;
 }
 
+// Keyset-paginated envelope returned by the /qa-logs and /low-similarity
+// list endpoints; next_cursor is an opaque token for the next page
+export interface Page<T> {
+  items: T[];
+  has_more: boolean;
+  next_cursor: string | null;
+}
+
 // User info type
 export interface UserInfo {
   username: string;